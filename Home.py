@@ -0,0 +1,35 @@
+import streamlit as st
+
+from safe_walk import common
+
+st.set_page_config(
+    page_title="Safe Walk - Chicago Crimes",
+    page_icon="🚶‍♂️🚨",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+st.title("🚶‍♂️ Safe Walk – Chicago Crime Dashboard")
+st.markdown("""
+Interactive dashboard to help understand crime patterns in Chicago
+and support safer walking decisions.
+
+Pick a page in the sidebar:
+
+- **Explorer** – map, trends and top crime types
+- **Forecast** – Prophet forecast for 2026+ with reduction scenarios
+- **Trend** – yearly trend with a simple 2026 linear projection
+""")
+
+df = common.load_data()
+
+min_y, max_y = common.year_bounds(df)
+
+st.subheader("Dataset")
+cols = st.columns(3)
+cols[0].metric("Total incidents", f"{len(df):,}")
+cols[1].metric("Years covered", f"{min_y} – {max_y}")
+cols[2].metric("Crime types", f"{len(common.get_crime_types(df)):,}")
+
+st.markdown("---")
+st.caption("Safe Walk Project • Data: City of Chicago • Built with ❤️ & Streamlit")
@@ -0,0 +1,191 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import numpy as np
+
+from safe_walk import common
+from safe_walk.common import DAY_NAMES
+
+st.set_page_config(page_title="Safe Walk • Explorer", page_icon="🗺️", layout="wide")
+
+st.title("🚶‍♂️ Safe Walk – Chicago Crime Explorer")
+
+MAX_MAP_POINTS = 12000
+
+df = common.load_data()
+con = common.get_con()
+
+year_range, selected_types, sel_types = common.sidebar_filters(df)
+filtered = common.apply_filters(df, year_range[0], year_range[1], selected_types)
+
+# ─── Quick stats ───
+st.subheader("Overview")
+cols = st.columns(4)
+cols[0].metric("Total incidents", f"{len(filtered):,}")
+cols[1].metric("Time period", f"{year_range[0]} – {year_range[1]}")
+cols[2].metric("Most common type", filtered['Primary Type'].mode()[0] if not filtered.empty else "–")
+cols[3].metric("Most common day", filtered['DayOfWeek'].mode()[0] if not filtered.empty else "–")
+
+# Each tab body is a fragment: a widget inside one tab (e.g. the top-N
+# slider or the map's Density/Points radio) reruns only that tab instead
+# of rebuilding every chart
+@st.fragment
+def render_map_tab(filtered):
+    st.subheader("Crime locations")
+
+    view = st.radio("View", ["Density", "Points"], horizontal=True)
+
+    if view == "Density" and con is not None:
+        # Server-side binned density – full counts, no marker sampling
+        agg = common.map_agg(con, year_range[0], year_range[1], sel_types)
+        if hasattr(px, 'density_map'):
+            # MapLibre chart – plotly ≥7 removed the Mapbox trace family
+            fig_map = px.density_map(
+                agg,
+                lat="lat_b",
+                lon="lon_b",
+                z="c",
+                radius=15,
+                zoom=9.5,
+                height=650,
+                map_style="carto-positron"
+            )
+        else:
+            fig_map = px.density_mapbox(
+                agg,
+                lat="lat_b",
+                lon="lon_b",
+                z="c",
+                radius=15,
+                zoom=9.5,
+                height=650
+            )
+            fig_map.update_layout(mapbox_style="carto-positron")
+        st.plotly_chart(fig_map, use_container_width=True)
+    elif 'Latitude' in filtered.columns and 'Longitude' in filtered.columns:
+        # Single canvas-rendered trace with an int colour array instead of
+        # px.scatter_mapbox's one-trace-per-category expansion; the point
+        # cap is deterministic rather than a fresh random sample per rerun
+        points = filtered.head(MAX_MAP_POINTS)
+        codes = points['Primary Type'].astype('category').cat.codes.to_numpy()
+        customdata = np.stack([
+            points['Primary Type'].astype(str),
+            points['Block'].astype(str),
+            points['Description'].astype(str),
+        ], axis=-1)
+        # MapLibre trace on plotly ≥7 (which removed the Mapbox family),
+        # Scattermapbox as the fallback on older releases
+        use_maplibre = hasattr(go, 'Scattermap')
+        trace_cls = go.Scattermap if use_maplibre else go.Scattermapbox
+        fig_map = go.Figure(trace_cls(
+            lat=points['Latitude'],
+            lon=points['Longitude'],
+            mode='markers',
+            marker=dict(size=4, color=codes, colorscale='Turbo', opacity=0.6),
+            customdata=customdata,
+            hovertemplate='%{customdata[0]}<br>%{customdata[1]}<br>%{customdata[2]}<extra></extra>'
+        ))
+        map_layout = dict(style="carto-positron", zoom=9.5,
+                          center=dict(lat=41.8781, lon=-87.6298))
+        fig_map.update_layout(
+            **({'map': map_layout} if use_maplibre else {'mapbox': map_layout}),
+            height=650,
+            margin={"r": 0, "t": 0, "l": 0, "b": 0}
+        )
+        st.plotly_chart(fig_map, use_container_width=True)
+    else:
+        st.info("No Latitude / Longitude columns found → map not available")
+
+
+@st.fragment
+def render_trends_tab(filtered):
+    st.subheader("Crimes per year")
+
+    # Reduced from the cached month × type tensor – no per-rerun groupby
+    yearly = common.yearly_series(df, year_range[0], year_range[1], sel_types)
+    # Small int dtypes serialize as smaller typed arrays in the plotly payload
+    yearly['Count'] = pd.to_numeric(yearly['Count'], downcast='integer')
+    fig_year = px.line(
+        yearly, x='Year', y='Count',
+        title="Total crimes per year",
+        markers=True,
+        color_discrete_sequence=['#ff4b4b']
+    )
+    fig_year.update_traces(marker=dict(size=10, line=dict(width=2, color='white')))
+    st.plotly_chart(fig_year, use_container_width=True)
+
+    st.subheader("Crimes by day of week")
+    if con is not None:
+        dow = common.dow_counts(con, year_range[0], year_range[1], sel_types)
+    else:
+        dow = filtered['DayOfWeek'].value_counts().reindex(
+            DAY_NAMES
+        ).reset_index(name='Count')
+    dow['Count'] = pd.to_numeric(dow['Count'], downcast='integer')
+    fig_dow = px.bar(dow, x='DayOfWeek', y='Count', color='Count')
+    st.plotly_chart(fig_dow, use_container_width=True)
+
+    st.subheader("Crimes by day & hour")
+    # One linear 7×24 bincount over int codes instead of two groupbys plus
+    # an unstack
+    dow_codes = (filtered['DayOfWeek'].astype('category')
+                 .cat.set_categories(DAY_NAMES).cat.codes.to_numpy())
+    hours = filtered['Hour'].fillna(-1).to_numpy('int64')
+    valid = (dow_codes >= 0) & (hours >= 0)
+    # Widen the int8 codes before packing – 6*24 overflows int8
+    z = np.bincount(dow_codes[valid].astype(np.int64) * 24 + hours[valid],
+                    minlength=7 * 24).reshape(7, 24)
+    fig_heat = go.Figure(data=go.Heatmap(
+        z=z,
+        x=np.arange(24),
+        y=DAY_NAMES,
+        colorscale='Blues',
+        showscale=True
+    ))
+    fig_heat.update_layout(xaxis_title="Hour", yaxis_title="Day", height=500)
+    st.plotly_chart(fig_heat, use_container_width=True)
+
+
+@st.fragment
+def render_topcrimes_tab(filtered):
+    st.subheader("Most frequent crime types")
+
+    top_n = st.slider("Show top N types", 5, 20, 10)
+    if con is not None:
+        top = common.top_types(con, year_range[0], year_range[1], sel_types, top_n)
+    elif isinstance(filtered['Primary Type'].dtype, pd.CategoricalDtype):
+        # bincount + argpartition: top-N via partial selection instead of
+        # value_counts' full sort of every category
+        ptype = filtered['Primary Type']
+        codes = ptype.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0],
+                             minlength=len(ptype.cat.categories))
+        n = min(top_n, len(counts))
+        idx = np.argpartition(-counts, n - 1)[:n]
+        idx = idx[np.argsort(-counts[idx])]
+        top = pd.DataFrame({'Type': ptype.cat.categories[idx],
+                            'Count': counts[idx]})
+    else:
+        top = filtered['Primary Type'].value_counts().head(top_n).reset_index()
+        top.columns = ['Type', 'Count']
+
+    fig_bar = px.bar(top, x='Count', y='Type',
+                     orientation='h',
+                     title=f"Top {top_n} crime types",
+                     color='Count',
+                     color_continuous_scale='reds')
+    fig_bar.update_layout(yaxis={'categoryorder': 'total ascending'})
+    st.plotly_chart(fig_bar, use_container_width=True)
+
+
+tab_map, tab_trends, tab_top = st.tabs(["🗺️ Map", "📊 Trends", "🏆 Top crimes"])
+
+with tab_map:
+    render_map_tab(filtered)
+
+with tab_trends:
+    render_trends_tab(filtered)
+
+with tab_top:
+    render_topcrimes_tab(filtered)
@@ -0,0 +1,64 @@
+import streamlit as st
+import plotly.graph_objects as go
+
+from safe_walk import common
+
+st.set_page_config(page_title="Safe Walk • Forecast", page_icon="🔮", layout="wide")
+
+st.title("🔮 Crime Forecast 2026+ (Prophet)")
+
+df = common.load_data()
+
+year_range, selected_types, sel_types = common.sidebar_filters(df)
+
+# Monthly aggregation reduced from the cached month × type tensor
+monthly = common.monthly_series(df, year_range[0], year_range[1], sel_types)
+
+if len(monthly) > 12:
+    forecast = common.fit_prophet(monthly, year_range[0], year_range[1], sel_types)
+
+    fig_fc = go.Figure()
+    fig_fc.add_trace(go.Scatter(
+        x=monthly['ds'], y=monthly['y'],
+        mode='markers', name='Actual monthly',
+        marker=dict(color='#ff4b4b', size=8, line=dict(width=2, color='white'))
+    ))
+    fig_fc.add_trace(go.Scatter(
+        x=forecast['ds'], y=forecast['yhat'],
+        mode='lines', name='Forecast',
+        line=dict(color='#00cc96', width=3)
+    ))
+    fig_fc.update_layout(
+        title="Monthly Crimes – Historical + Forecast (2026–2030)",
+        xaxis_title="Date",
+        yaxis_title="Number of Crimes",
+        hovermode='x unified'
+    )
+    st.plotly_chart(fig_fc, use_container_width=True)
+
+    # Summary numbers
+    st.markdown("**Estimated annual crimes (Prophet forecast):**")
+    cols = st.columns(3)
+    for col, year in zip(cols, (2026, 2027, 2028)):
+        total = forecast.loc[forecast['ds'].dt.year == year, 'yhat'].sum()
+        col.metric(str(year), f"{int(round(total)):,}")
+
+    # Reduction scenarios – a fragment, so dragging the slider only
+    # rescales yhat (one numpy multiply) without re-running the script
+    @st.fragment
+    def render_reduction(forecast):
+        st.markdown("**Crime Reduction Scenarios** (e.g., interventions)")
+        reduction_pct = st.slider("Assumed reduction % (due to policing/community programs)", 0, 50, 10)
+        is_2026 = forecast['ds'].dt.year == 2026
+        baseline_2026 = forecast.loc[is_2026, 'yhat'].sum()
+        reduced_2026 = baseline_2026 * (1 - reduction_pct / 100)
+
+        st.metric("Projected 2026 Crimes (baseline)", f"{baseline_2026:,.0f}")
+        st.metric(f"With {reduction_pct}% reduction", f"{reduced_2026:,.0f}",
+                  delta=f"-{(forecast['yhat'].sum() * reduction_pct / 100):.0f}")
+
+    render_reduction(forecast)
+
+    st.info("Forecast uses Facebook Prophet • Monthly aggregation • Reduction is hypothetical")
+else:
+    st.warning("Not enough monthly data for reliable forecasting (need at least 12+ months)")
@@ -0,0 +1,93 @@
+import streamlit as st
+import pandas as pd
+import plotly.graph_objects as go
+import numpy as np
+
+from safe_walk import common
+
+st.set_page_config(page_title="Safe Walk • 2026 Trend", page_icon="📉", layout="wide")
+
+st.title("📉 Crime Trends & 2026 Projection")
+st.markdown("Yearly trend with hollow markers and a simple 2026 linear forecast")
+
+df = common.load_data()
+
+year_range, selected_types, sel_types = common.sidebar_filters(df)
+filtered = common.apply_filters(df, year_range[0], year_range[1], selected_types)
+
+# ─── Prepare yearly summary for trend ───
+# Reduced from the cached month × type tensor – no per-rerun groupby
+yearly = common.yearly_series(df, year_range[0], year_range[1], sel_types)
+# Small int dtypes serialize as smaller typed arrays in the plotly payload
+yearly['Count'] = pd.to_numeric(yearly['Count'], downcast='integer')
+
+# ─── 2026 simple prediction (linear on recent 5 years) ───
+pred_2026 = None
+if len(yearly) >= 5:
+    recent = yearly.tail(5)
+    coeffs = np.polyfit(recent['Year'].values, recent['Count'].values, 1)
+    pred_2026 = max(int(round(coeffs[0] * 2026 + coeffs[1])), 0)
+
+fig = go.Figure()
+
+# Main trend line + hollow markers
+fig.add_trace(
+    go.Scatter(
+        x=yearly['Year'],
+        y=yearly['Count'],
+        mode='lines+markers',
+        name='Total Crimes',
+        line=dict(color='#ff5555', width=3),
+        marker=dict(
+            size=12,
+            color='#ff5555',
+            line=dict(width=2.5, color='white'),  # hollow effect
+            symbol='circle'
+        ),
+        hovertemplate='Year: %{x}<br>Crimes: <b>%{y:,}</b><extra></extra>'
+    )
+)
+
+# Prediction point + line if enabled
+if pred_2026 is not None:
+    fig.add_trace(
+        go.Scatter(
+            x=[yearly['Year'].iloc[-1], 2026],
+            y=[yearly['Count'].iloc[-1], pred_2026],
+            mode='lines+markers',
+            name='2026 Projection',
+            line=dict(color='#ffaa00', width=3, dash='dot'),
+            marker=dict(
+                size=16,
+                color='#ffaa00',
+                symbol='diamond',
+                line=dict(width=3, color='white')
+            ),
+            hovertemplate=f'Year: 2026<br>Projected Crimes: <b>{pred_2026:,}</b> (linear trend)<extra></extra>'
+        )
+    )
+
+fig.update_layout(
+    xaxis=dict(title="Year"),
+    yaxis=dict(title="Number of Crimes"),
+    hovermode='x unified',
+    showlegend=True,
+    height=580,
+    margin=dict(l=50, r=50, t=40, b=60)
+)
+
+st.plotly_chart(fig, use_container_width=True)
+
+# ─── Summary cards ───
+st.markdown("---")
+cols = st.columns(3)
+cols[0].metric("Total Crimes (filtered)", f"{len(filtered):,}")
+cols[1].metric("Years Shown", f"{year_range[0]} – {year_range[1]}")
+if pred_2026 is not None:
+    cols[2].metric("Projected 2026 Crimes", f"{pred_2026:,}", delta="linear trend", delta_color="inverse")
+
+st.caption("Projection: simple linear fit on recent years • Hover over points for details")
+
+# Optional: raw data preview
+with st.expander("View Filtered Data Sample"):
+    st.dataframe(filtered.head(1500))
@@ -0,0 +1,371 @@
+"""Shared data loading, caching and aggregation for the Safe Walk pages.
+
+All pages run in one Streamlit process, so the @st.cache_data /
+@st.cache_resource entries here (the DataFrame, the DuckDB connection,
+the fitted Prophet models) exist once and are shared across pages.
+"""
+
+import os
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+# Columns the app actually uses + derived columns baked into the Parquet file
+CSV_COLUMNS = ['Date', 'Primary Type', 'Latitude', 'Longitude',
+               'District', 'Beat', 'Block', 'Description']
+DERIVED_COLUMNS = ['Year', 'MonthStart', 'DayOfWeek', 'Hour']
+DAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday',
+             'Friday', 'Saturday', 'Sunday']
+ROW_GROUP_SIZE = 262_144
+CSV_DTYPES = {'Primary Type': 'category', 'District': 'Int16',
+              'Beat': 'Int32', 'Block': 'category', 'Description': 'category'}
+DATE_FORMAT = '%m/%d/%Y %I:%M:%S %p'
+
+# Change this list if your file is in a different location
+POSSIBLE_PATHS = [
+    "crimes.csv",
+    "archive/crimes.csv",
+    "/Users/akumaresan/Downloads/archive/crimes.csv",
+    "data/crimes.csv"
+]
+
+CATEGORY_COLUMNS = ('Primary Type', 'District', 'Beat', 'Description',
+                    'Block', 'DayOfWeek')
+
+
+def _find_csv():
+    for path in POSSIBLE_PATHS:
+        parquet_path = os.path.splitext(path)[0] + '.parquet'
+        if os.path.exists(parquet_path) or os.path.exists(path):
+            return path
+    return None
+
+
+def _to_categorical(col):
+    # astype('category') on an Arrow-backed dictionary column raises
+    # ArrowInvalid when a chunk contains nulls; rebuild from the codes
+    # instead, mapping nulls to -1 (pandas' missing-category code)
+    arr = getattr(col.array, '_pa_array', None)
+    if arr is not None and pa is not None and pa.types.is_dictionary(arr.type):
+        combined = arr.combine_chunks()
+        codes = combined.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+        return pd.Categorical.from_codes(
+            codes, categories=combined.dictionary.to_pylist())
+    return col.astype('category')
+
+
+def _categorize(df):
+    # pandas Categorical: isin/value_counts/mode run on integer codes and
+    # the pickled frame Streamlit caches shrinks several-fold
+    for c in CATEGORY_COLUMNS:
+        if c in df.columns:
+            df[c] = _to_categorical(df[c])
+    # float32 keeps ~1 m coordinate precision, plenty for a city map, at
+    # half the memory bandwidth of float64
+    for c in ('Latitude', 'Longitude'):
+        if c in df.columns:
+            df[c] = df[c].astype('float32')
+    return df
+
+
+def _derived_batch(batch):
+    # Append Year/MonthStart/DayOfWeek/Hour once at conversion time so the
+    # app never touches .dt accessors on the full frame at runtime. Date
+    # arrives as string and is parsed here with error_is_null so a blank or
+    # malformed value becomes NaT instead of aborting the conversion.
+    date = pc.strptime(batch.column('Date'), format=DATE_FORMAT,
+                       unit='ns', error_is_null=True)
+    arrays = [date if name == 'Date' else batch.column(name)
+              for name in batch.schema.names] + [
+        pc.year(date).cast(pa.int16()),
+        pc.floor_temporal(date, unit='month'),
+        pa.DictionaryArray.from_arrays(
+            pc.day_of_week(date).cast(pa.int8()), pa.array(DAY_NAMES)),
+        pc.hour(date).cast(pa.int8()),
+    ]
+    return pa.Table.from_arrays(arrays, names=batch.schema.names + DERIVED_COLUMNS)
+
+
+def _ensure_parquet(csv_path):
+    # One-time CSV → Parquet conversion, streamed in chunks so the full CSV
+    # never sits in memory; later runs read only the Parquet sibling
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if os.path.exists(parquet_path):
+        return parquet_path
+
+    convert_options = pacsv.ConvertOptions(
+        include_columns=CSV_COLUMNS,
+        # Date stays string here; _derived_batch parses it null-safely
+        column_types={'Date': pa.string(),
+                      'Latitude': pa.float32(), 'Longitude': pa.float32()},
+    )
+    # Write to a temp sibling and rename only on success; a failed or
+    # interrupted conversion must not leave a readable truncated file that
+    # later runs would silently serve as the full dataset
+    tmp_path = parquet_path + '.tmp'
+    writer = None
+    try:
+        with pacsv.open_csv(csv_path, convert_options=convert_options) as reader:
+            for batch in reader:
+                table = _derived_batch(batch)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, table.schema,
+                                              use_dictionary=True)
+                writer.write_table(table, row_group_size=ROW_GROUP_SIZE)
+        if writer is not None:
+            writer.close()
+            writer = None
+            os.rename(tmp_path, parquet_path)
+    finally:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return parquet_path
+
+
+@st.cache_data(show_spinner="Loading Chicago crimes data…")
+def load_data():
+    path = _find_csv()
+    if path is None:
+        st.error("Could not find crimes.csv in any common location.\n"
+                 "Please place the file in the project folder or update "
+                 "POSSIBLE_PATHS in safe_walk/common.py.")
+        st.stop()
+
+    if pa is not None:
+        parquet_path = _ensure_parquet(path)
+        table = pq.read_table(parquet_path, columns=CSV_COLUMNS + DERIVED_COLUMNS)
+        return _categorize(table.to_pandas(types_mapper=pd.ArrowDtype))
+
+    # pyarrow unavailable – fall back to the old CSV loader
+    df = pd.read_csv(
+        path,
+        usecols=CSV_COLUMNS,
+        dtype=CSV_DTYPES,
+        engine='c',
+    )
+    # Fixed-format parse keeps the C fast path; errors='coerce' keeps the
+    # baseline tolerance for malformed dates (read_csv's parse_dates would
+    # silently leave the column as object on the first bad value)
+    df['Date'] = pd.to_datetime(df['Date'], format=DATE_FORMAT, errors='coerce')
+    df['Year'] = df['Date'].dt.year.astype("Int64")
+    # Integer codes + a 7-element Categorical: a single numpy cast and
+    # no per-row string / Period allocation
+    df['MonthStart'] = df['Date'].values.astype('datetime64[M]')
+    df['DayOfWeek'] = pd.Categorical.from_codes(
+        df['Date'].dt.dayofweek.fillna(-1).astype('int8'), categories=DAY_NAMES)
+    df['Hour'] = df['Date'].dt.hour
+    return _categorize(df)
+
+
+@st.cache_resource
+def _open_con(parquet_path):
+    # Shared DuckDB connection over the Parquet file; filtered aggregations
+    # stay columnar and skip row groups via the Parquet min/max statistics
+    con = duckdb.connect()
+    con.execute("PRAGMA threads=8")
+    con.execute(f"CREATE VIEW crimes AS SELECT * FROM read_parquet('{parquet_path}')")
+    return con
+
+
+def get_con():
+    # None when DuckDB or the Parquet sibling is unavailable; callers fall
+    # back to pandas over the cached frame
+    csv_path = _find_csv()
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet' if csv_path else None
+    if duckdb is not None and parquet_path and os.path.exists(parquet_path):
+        return _open_con(parquet_path)
+    return None
+
+
+def _crimes_where(y0, y1, types):
+    # Shared WHERE clause; an empty type selection means "all types"
+    clause = "WHERE Year BETWEEN ? AND ?"
+    params = [y0, y1]
+    if types:
+        clause += ' AND "Primary Type" IN (SELECT UNNEST(?))'
+        params.append(list(types))
+    return clause, params
+
+
+@st.cache_data
+def top_types(_con, y0, y1, types, n):
+    clause, params = _crimes_where(y0, y1, types)
+    return _con.execute(
+        f'SELECT "Primary Type" AS Type, COUNT(*) AS Count FROM crimes {clause} '
+        "GROUP BY 1 ORDER BY Count DESC LIMIT ?", params + [n]).df()
+
+
+@st.cache_data
+def dow_counts(_con, y0, y1, types):
+    clause, params = _crimes_where(y0, y1, types)
+    counts = _con.execute(
+        f"SELECT DayOfWeek, COUNT(*) AS Count FROM crimes {clause} "
+        "GROUP BY 1", params).df()
+    return (counts.set_index('DayOfWeek').reindex(DAY_NAMES)
+            .reset_index())
+
+
+@st.cache_data
+def map_agg(_con, y0, y1, types, bin_size=0.002):
+    # Grid-bin lat/lon server-side so the map draws a few thousand weighted
+    # cells at full density instead of thousands of sampled DOM markers
+    clause, params = _crimes_where(y0, y1, types)
+    return _con.execute(
+        "SELECT floor(Latitude / ?) * ? AS lat_b, "
+        "floor(Longitude / ?) * ? AS lon_b, COUNT(*) AS c "
+        f"FROM crimes {clause} "
+        "AND Latitude IS NOT NULL AND Longitude IS NOT NULL "
+        "GROUP BY 1, 2", [bin_size] * 4 + params).df()
+
+
+@st.cache_data
+def _month_type_counts(_df):
+    """Dense (n_months × n_types) event-count tensor, built once per load.
+
+    Returns (counts, origin, categories); every yearly and monthly series
+    afterwards is a column-mask plus a vector sum over ≈7200 cells instead
+    of a groupby over millions of event rows.
+    """
+    ptype = _df['Primary Type']
+    if not isinstance(ptype.dtype, pd.CategoricalDtype):
+        ptype = ptype.astype('category')
+    categories = ptype.cat.categories
+    codes = ptype.cat.codes.to_numpy()
+    months = _df['MonthStart'].to_numpy(dtype='datetime64[ns]').astype('datetime64[M]')
+    valid = ~np.isnat(months) & (codes >= 0)
+    if not valid.any():
+        return np.zeros((0, len(categories)), dtype=np.int64), None, categories
+    months = months[valid]
+    origin = months.min()
+    midx = (months - origin).astype('int64')
+    # Packed linear bincount over (month, type) pairs – one pass, no add.at
+    counts = np.bincount(
+        midx * len(categories) + codes[valid],
+        minlength=(midx.max() + 1) * len(categories),
+    ).reshape(-1, len(categories))
+    return counts, origin, categories
+
+
+def _type_mask(categories, types):
+    # Empty selection means "all types", matching _crimes_where
+    if not types:
+        return np.ones(len(categories), dtype=bool)
+    mask = np.zeros(len(categories), dtype=bool)
+    idx = categories.get_indexer(list(types))
+    mask[idx[idx >= 0]] = True
+    return mask
+
+
+def _masked_series(df, y0, y1, types):
+    # Shared tensor reduction: per-month totals plus the year of each month
+    counts, origin, categories = _month_type_counts(df)
+    series = counts[:, _type_mask(categories, types)].sum(axis=1)
+    if not len(series):
+        return (np.array([], dtype='datetime64[M]'),
+                np.array([], dtype='int64'), series)
+    months = origin + np.arange(len(series)).astype('timedelta64[M]')
+    years = months.astype('datetime64[Y]').astype('int64') + 1970
+    keep = (years >= y0) & (years <= y1)
+    return months[keep], years[keep], series[keep]
+
+
+def yearly_series(df, y0, y1, types):
+    months, years, series = _masked_series(df, y0, y1, types)
+    if not len(years):
+        return pd.DataFrame({'Year': [], 'Count': []})
+    totals = np.bincount(years - years[0], weights=series).astype('int64')
+    return pd.DataFrame({'Year': np.arange(years[0], years[-1] + 1),
+                         'Count': totals})
+
+
+def monthly_series(df, y0, y1, types):
+    months, years, series = _masked_series(df, y0, y1, types)
+    return pd.DataFrame({'ds': months.astype('datetime64[ns]'), 'y': series})
+
+
+@st.cache_resource(show_spinner="Fitting Prophet model (first run per filter)…")
+def fit_prophet(_monthly, y0, y1, types):
+    # _monthly is underscore-prefixed so only the widget scalars form the
+    # cache key; unrelated widget changes reuse the fitted model instead of
+    # triggering a 10–30 s refit
+    from prophet import Prophet  # deferred – pages that never forecast skip it
+
+    # CmdStanPy runs a pre-compiled Stan binary (no per-call JIT) and
+    # uncertainty_samples=0 skips the posterior draw behind the
+    # yhat_lower/yhat_upper bands the charts never show
+    m = Prophet(
+        yearly_seasonality=True,
+        weekly_seasonality=False,
+        daily_seasonality=False,
+        seasonality_mode='multiplicative',
+        uncertainty_samples=0,
+        stan_backend='CMDSTANPY',
+    )
+    m.fit(_monthly)
+    # 'MS' (month start) works on pandas 2 and 3 – the 'M' alias is gone in
+    # pandas 3 – and matches the month-start ds values monthly_series emits
+    future = m.make_future_dataframe(periods=60, freq='MS')
+    forecast = m.predict(future)
+    return forecast
+
+
+def apply_filters(df, y0, y1, selected_types):
+    # One fused boolean mask over numpy arrays and a single take – no
+    # intermediate DataFrame materialized per predicate
+    mask = np.ones(len(df), dtype=bool)
+    if 'Year' in df.columns:
+        year = df['Year'].to_numpy(dtype='float64', na_value=np.nan)
+        mask &= (year >= y0) & (year <= y1)
+    if selected_types and 'Primary Type' in df.columns:
+        ptype = df['Primary Type']
+        if isinstance(ptype.dtype, pd.CategoricalDtype):
+            sel = ptype.cat.categories.get_indexer(list(selected_types))
+            mask &= np.isin(ptype.cat.codes.to_numpy(), sel[sel >= 0])
+        else:
+            mask &= ptype.isin(selected_types).to_numpy()
+    return df.iloc[np.flatnonzero(mask)]
+
+
+@st.cache_data
+def get_crime_types(_df):
+    # _df is underscore-prefixed so Streamlit skips hashing the big frame;
+    # the dataset behind it is stable for the process lifetime
+    return sorted(_df['Primary Type'].dropna().unique().tolist())
+
+
+@st.cache_data
+def year_bounds(_df):
+    return int(_df['Year'].min()), int(_df['Year'].max())
+
+
+def sidebar_filters(df):
+    """Render the shared sidebar widgets and return the filter state.
+
+    Returns (year_range, selected_types, sel_types) where sel_types is the
+    sorted tuple used as the cache key for the aggregate helpers.
+    """
+    with st.sidebar:
+        st.header("Filters")
+        min_y, max_y = year_bounds(df)
+        year_range = st.slider("Year range", min_y, max_y, (max_y - 10, max_y))
+        crime_types = get_crime_types(df)
+        selected_types = st.multiselect("Crime types", crime_types,
+                                        default=crime_types[:10])
+    sel_types = tuple(sorted(selected_types)) if selected_types else ()
+    return year_range, selected_types, sel_types